@@ -3,11 +3,8 @@
 from __future__ import annotations
 import logging
 
-from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 
-from aiolyric import Lyric
 from aiolyric.objects.device import LyricDevice
 from aiolyric.objects.location import LyricLocation
 from aiolyric.objects.priority import LyricAccessory, LyricRoom
@@ -27,91 +24,85 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import generate_entity_id
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import StateType
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
 )
-from .entity import LyricAccessoryEntity, LyricDeviceEntity, LyricLeakEntity
+from .coordinator import LyricDataUpdateCoordinator
+from .entity import (
+    LyricAccessoryEntity,
+    LyricDeviceEntity,
+    LyricLeakEntity,
+    get_attribute_path,
+    has_attribute_path,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-class LyricLeakDevice(LyricDevice):
-    """Attempt to extend a LyricDevice to provide Water Leak properties without
-        changing AIOLyric or the value_fn/suitable_fn functionality"""
-
-    @property 
-    def waterPresent(self):
-        """Return the waterPresent bool"""
-        return self.attributes.get("waterPresent", None)
-
 @dataclass(frozen=True, kw_only=True)
 class LyricBinarySensorEntityDescription(BinarySensorEntityDescription):
-    """Class describing Honeywell Lyric binary sensor entities."""
+    """Class describing Honeywell Lyric binary sensor entities.
 
-    value_fn: Callable[[LyricLeakDevice], StateType | datetime]
-    suitable_fn: Callable[[LyricLeakDevice], bool]
+    ``attr_path`` is the device attribute the sensor reads; the sensor is
+    suitable for a device if it is present.
+    """
 
+    attr_path: tuple[str, ...]
 
-DEVICE_BINARY_SENSORS: list[LyricBinarySensorEntityDescription] = [
+
+DEVICE_BINARY_SENSORS: tuple[LyricBinarySensorEntityDescription, ...] = (
     LyricBinarySensorEntityDescription(
         key="Water Present",
         translation_key="waterPresent",
         device_class=BinarySensorDeviceClass.MOISTURE,
-        value_fn=lambda device: bool(device.attributes.get("waterPresent")),
-        suitable_fn=lambda device: device.attributes.get("waterPresent"),
+        attr_path=("attributes", "waterPresent"),
     ),
     LyricBinarySensorEntityDescription(
         key="Alive",
         translation_key="isAlive",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        value_fn=lambda device: bool(device.attributes.get("isAlive")),
-        suitable_fn=lambda device: device.attributes.get("isAlive"),
+        attr_path=("attributes", "isAlive"),
     ),
     # LyricBinarySensorEntityDescription(
     #     key="Firmware Update",
     #     translation_key="isFirmwareUpdateRequired",
     #     device_class=BinarySensorDeviceClass.PROBLEM,
-    #     value_fn=lambda device: bool(device.attributes.get("isFirmwareUpdateRequired")),
-    #     suitable_fn=lambda device: device.attributes.get("isFirmwareUpdateRequired"),
+    #     attr_path=("attributes", "isFirmwareUpdateRequired"),
     # ),
-]
+)
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the Honeywell Lyric binary sensor platform based on a config entry."""
-    coordinator: DataUpdateCoordinator[Lyric] = hass.data[DOMAIN][entry.entry_id]
+    coordinator: LyricDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(
-        LyricLeakBinarySensor(
-            coordinator,
-            device_sensor,
-            location,
-            device,
-        )
-        for location in coordinator.data.locations
-        for device in location.devices
-        for device_sensor in DEVICE_BINARY_SENSORS
-        # if device_sensor.suitable_fn(device)
-    )
+    entities: list[BinarySensorEntity] = []
+    for location in coordinator.data.locations:
+        for device in location.devices:
+            entities.extend(
+                LyricLeakBinarySensor(coordinator, device_sensor, location, device)
+                for device_sensor in DEVICE_BINARY_SENSORS
+                if has_attribute_path(device, device_sensor.attr_path)
+            )
+
+    async_add_entities(entities)
 
 class LyricLeakBinarySensor(LyricLeakEntity, BinarySensorEntity):
     """Defines a Honeywell Lyric water leak sensor entity."""
 
-    coordinator: DataUpdateCoordinator[Lyric]
-    entity_description: BinarySensorEntityDescription
+    coordinator: LyricDataUpdateCoordinator
+    entity_description: LyricBinarySensorEntityDescription
 
     _attr_name = None
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator[Lyric],
-        description: BinarySensorEntityDescription,
+        coordinator: LyricDataUpdateCoordinator,
+        description: LyricBinarySensorEntityDescription,
         location: LyricLocation,
-        device: LyricLeakDevice,
+        device: LyricDevice,
     ) -> None:
         """Initialize Honeywell Lyric leak entity."""
 
@@ -132,45 +123,31 @@ class LyricLeakBinarySensor(LyricLeakEntity, BinarySensorEntity):
 
         # Need to 'recreate' the location.devices_dict since AioLyric uses device.mac_id 
 
-        _LOGGER.debug("device type: %s", type(device))
-
-        for attr in device.attributes:
-            _LOGGER.debug("device key and value: %s - %s", attr, device.attributes.get(attr))
-
-        _LOGGER.debug("location.devices_dict type: %s", type(location.devices_dict))
-        _LOGGER.debug("location:")
-        _LOGGER.debug(location)
-
-        _LOGGER.debug("device_dict:")
-        _LOGGER.debug(location.devices_dict)
+        _LOGGER.debug(
+            "device type=%s attrs=%s location=%s devices_dict=%s",
+            type(device),
+            device.attributes,
+            location,
+            location.devices_dict,
+        )
 
-        for key in location.devices_dict.keys():
-            _LOGGER.debug("location key and value: %s - %s", key, location.devices_dict[key])
+        user_defined_name = device.attributes["deviceSettings"]["userDefinedName"]
+        self._attr_name = f"{user_defined_name} {description.key}"
 
-        self._attr_sensor_id = f"{description.translation_key}"
-        self._attr_unique_id = f"{device.attributes.get("deviceSettings", None)["userDefinedName"]}_{description.translation_key}"
-        _LOGGER.debug("unique_id: %s", self._attr_unique_id)
+        unique_id = f"{user_defined_name}_{description.translation_key}"
+        self._attr_sensor_id = description.translation_key
+        self._attr_unique_id = unique_id
+        _LOGGER.debug("unique_id: %s", unique_id)
         
-        self.entity_id  = generate_entity_id("binary_sensor.{}", self._attr_unique_id, None, coordinator.hass)
-        self._attr_entity_id = self.entity_id
+        self.entity_id  = generate_entity_id("binary_sensor.{}", unique_id, None, coordinator.hass)
 
-        super().__init__(
-            coordinator,
-            location,
-            device,
-            f"{device.attributes.get("deviceSettings", None)["userDefinedName"]}_{description.translation_key}",
-        )
+        super().__init__(coordinator, location, device, unique_id)
         self.entity_description = description
 
     @property
     def is_on(self) -> bool:
         """Return the state."""
-        return self.entity_description.value_fn(self.device)
-
-    @property
-    def name(self) -> str | None:
-        """Define name as description"""
-        return f"{self.device.attributes.get("deviceSettings", None)["userDefinedName"]} {self.entity_description.key}"
+        return bool(get_attribute_path(self.device, self.entity_description.attr_path))
 
     # @property
     # def icon(self) -> str | None:
@@ -8,7 +8,6 @@ import logging
 from time import localtime, strftime, time
 from typing import Any
 
-from aiolyric import Lyric
 from aiolyric.objects.device import LyricDevice
 from aiolyric.objects.location import LyricLocation
 import voluptuous as vol
@@ -38,7 +37,6 @@ from homeassistant.helpers import entity_platform
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import VolDictType
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
     DOMAIN,
@@ -49,6 +47,7 @@ from .const import (
     PRESET_TEMPORARY_HOLD,
     PRESET_VACATION_HOLD,
 )
+from .coordinator import LyricDataUpdateCoordinator
 from .entity import LyricDeviceEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -125,7 +124,7 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the Honeywell Lyric climate platform based on a config entry."""
-    coordinator: DataUpdateCoordinator[Lyric] = hass.data[DOMAIN][entry.entry_id]
+    coordinator: LyricDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     async_add_entities(
         (
@@ -163,7 +162,7 @@ class LyricThermostatType(enum.Enum):
 class LyricClimate(LyricDeviceEntity, ClimateEntity):
     """Defines a Honeywell Lyric climate entity."""
 
-    coordinator: DataUpdateCoordinator[Lyric]
+    coordinator: LyricDataUpdateCoordinator
     entity_description: ClimateEntityDescription
 
     _attr_name = None
@@ -177,7 +176,7 @@ class LyricClimate(LyricDeviceEntity, ClimateEntity):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator[Lyric],
+        coordinator: LyricDataUpdateCoordinator,
         description: ClimateEntityDescription,
         location: LyricLocation,
         device: LyricDevice,
@@ -366,7 +365,7 @@ class LyricClimate(LyricDeviceEntity, ClimateEntity):
                 )
             except LYRIC_EXCEPTIONS as exception:
                 _LOGGER.error(exception)
-            await self.coordinator.async_refresh()
+            await self.coordinator.async_refresh_after_write()
         else:
             temp = kwargs.get(ATTR_TEMPERATURE)
             _LOGGER.debug("Set temperature: %s", temp)
@@ -381,7 +380,7 @@ class LyricClimate(LyricDeviceEntity, ClimateEntity):
                     )
             except LYRIC_EXCEPTIONS as exception:
                 _LOGGER.error(exception)
-            await self.coordinator.async_refresh()
+            await self.coordinator.async_refresh_after_write()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set hvac mode."""
@@ -394,7 +393,7 @@ class LyricClimate(LyricDeviceEntity, ClimateEntity):
                     await self._async_set_hvac_mode_lcc(hvac_mode)
         except LYRIC_EXCEPTIONS as exception:
             _LOGGER.error(exception)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_refresh_after_write()
 
     async def _async_set_hvac_mode_tcc(self, hvac_mode: HVACMode) -> None:
         """Set hvac mode for TCC devices (e.g., Lyric round)."""
@@ -472,7 +471,7 @@ class LyricClimate(LyricDeviceEntity, ClimateEntity):
             )
         except LYRIC_EXCEPTIONS as exception:
             _LOGGER.error(exception)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_refresh_after_write()
 
     async def async_set_hold_time(self, time_period: str) -> None:
         """Set the time to hold until."""
@@ -486,7 +485,7 @@ class LyricClimate(LyricDeviceEntity, ClimateEntity):
             )
         except LYRIC_EXCEPTIONS as exception:
             _LOGGER.error(exception)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_refresh_after_write()
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set fan mode."""
@@ -503,4 +502,4 @@ class LyricClimate(LyricDeviceEntity, ClimateEntity):
                 "The fan mode requested does not have a corresponding mode in lyric: %s",
                 fan_mode,
             )
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_refresh_after_write()
@@ -0,0 +1,118 @@
+"""Data update coordinator for the Honeywell Lyric integration."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+import logging
+
+from aiolyric import Lyric
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# Polling interval. Will only be polled if there are subscribers.
+UPDATE_INTERVAL = timedelta(seconds=300)
+# Refreshes requested sooner than this after a fetch reuse the current data,
+# unless a write to Lyric has been made since.
+MIN_REFRESH_INTERVAL = timedelta(seconds=60)
+# Entities keep showing the last known data through failed updates for this long.
+MAX_STALE_INTERVAL = 3 * UPDATE_INTERVAL
+
+
+class LyricDataUpdateCoordinator(DataUpdateCoordinator[Lyric]):
+    """Coordinate Lyric updates, skipping refreshes while the data is fresh."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        update_method: Callable[[], Awaitable[Lyric]],
+    ) -> None:
+        """Initialize the Lyric coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            # Name of the data. For logging purposes.
+            name="lyric_coordinator",
+            update_method=update_method,
+            update_interval=UPDATE_INTERVAL,
+        )
+        self.last_update_success_time: datetime | None = None
+        self._write_pending = False
+        self._unsub_stale_expiry: CALLBACK_TYPE | None = None
+
+    async def async_refresh_after_write(self) -> None:
+        """Refresh data from Lyric after a change was sent to it."""
+        self._write_pending = True
+        await self.async_refresh()
+
+    async def _async_update_data(self) -> Lyric:
+        """Fetch data from Lyric, unless the last fetch is recent enough."""
+        if (
+            self.data is not None
+            and self.last_update_success
+            and not self._write_pending
+            and self.last_update_success_time is not None
+            and dt_util.utcnow() - self.last_update_success_time < MIN_REFRESH_INTERVAL
+        ):
+            _LOGGER.debug("Lyric data is still fresh, skipping refresh")
+            return self.data
+
+        try:
+            data = await super()._async_update_data()
+        except Exception:
+            self._schedule_stale_expiry()
+            raise
+        self._cancel_stale_expiry()
+        self._write_pending = False
+        self.last_update_success_time = dt_util.utcnow()
+        return data
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled stale data expiry and shut down."""
+        self._cancel_stale_expiry()
+        await super().async_shutdown()
+
+    def _schedule_stale_expiry(self) -> None:
+        """Notify entities once the last known data has become too old to show.
+
+        Consecutive failed refreshes do not notify listeners, so without this
+        entities would never re-check availability during an outage.
+        """
+        if self._unsub_stale_expiry is not None or not self.has_recent_data:
+            return
+        delay = MAX_STALE_INTERVAL - (dt_util.utcnow() - self.last_update_success_time)
+        self._unsub_stale_expiry = async_call_later(
+            self.hass, delay, self._handle_stale_expiry
+        )
+
+    def _cancel_stale_expiry(self) -> None:
+        """Cancel the scheduled stale data expiry."""
+        if self._unsub_stale_expiry is not None:
+            self._unsub_stale_expiry()
+            self._unsub_stale_expiry = None
+
+    @callback
+    def _handle_stale_expiry(self, _now: datetime) -> None:
+        """Write entity states now that the last known data has expired."""
+        self._unsub_stale_expiry = None
+        if self.has_recent_data:
+            # Timer fired marginally early
+            self._schedule_stale_expiry()
+            return
+        self.async_update_listeners()
+
+    @property
+    def has_recent_data(self) -> bool:
+        """Return if the last successful fetch is recent enough to keep showing."""
+        return (
+            self.last_update_success_time is not None
+            and dt_util.utcnow() - self.last_update_success_time < MAX_STALE_INTERVAL
+        )
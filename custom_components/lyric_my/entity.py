@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 import logging
+from typing import Any
 
-from aiolyric import Lyric
 from aiolyric.objects.device import LyricDevice
 from aiolyric.objects.location import LyricLocation
 from aiolyric.objects.priority import LyricAccessory, LyricRoom
@@ -11,24 +11,52 @@ from aiolyric.objects.priority import LyricAccessory, LyricRoom
 from .const import (
     DOMAIN,
 )
+from .coordinator import LyricDataUpdateCoordinator
 
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 _LOGGER = logging.getLogger(__name__)
 
-class LyricEntity(CoordinatorEntity[DataUpdateCoordinator[Lyric]]):
+
+def get_attribute_path(obj: Any, path: tuple[str, ...]) -> Any:
+    """Walk attribute names or dict keys from obj, or return None if missing."""
+    for key in path:
+        if obj is None:
+            return None
+        obj = obj.get(key) if isinstance(obj, dict) else getattr(obj, key, None)
+    return obj
+
+
+def has_attribute_path(obj: Any, path: tuple[str, ...]) -> bool:
+    """Return if the last key of path exists, even if its value is None."""
+    parent = get_attribute_path(obj, path[:-1])
+    if isinstance(parent, dict):
+        return path[-1] in parent
+    return parent is not None and hasattr(parent, path[-1])
+
+
+class LyricCoordinatorEntity(CoordinatorEntity[LyricDataUpdateCoordinator]):
+    """Defines a Honeywell Lyric coordinator entity."""
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available, keeping recent data after a failed update."""
+        return (
+            self.coordinator.last_update_success
+            or self.coordinator.has_recent_data
+        )
+
+
+class LyricEntity(LyricCoordinatorEntity):
     """Defines a base Honeywell Lyric entity."""
 
     _attr_has_entity_name = True
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator[Lyric],
+        coordinator: LyricDataUpdateCoordinator,
         location: LyricLocation,
         device: LyricDevice,
         key: str,
@@ -77,7 +105,7 @@ class LyricAccessoryEntity(LyricDeviceEntity):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator[Lyric],
+        coordinator: LyricDataUpdateCoordinator,
         location: LyricLocation,
         device: LyricDevice,
         room: LyricRoom,
@@ -120,7 +148,7 @@ class LyricAccessoryEntity(LyricDeviceEntity):
         )
 
 
-class LyricLeakEntity(CoordinatorEntity[DataUpdateCoordinator[Lyric]]):
+class LyricLeakEntity(LyricCoordinatorEntity):
     """Defines a Honeywell Lyric water leak entity."""
 
     _attr_has_entity_name = True
@@ -129,7 +157,7 @@ class LyricLeakEntity(CoordinatorEntity[DataUpdateCoordinator[Lyric]]):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator[Lyric],
+        coordinator: LyricDataUpdateCoordinator,
         location: LyricLocation,
         device: LyricDevice,
         key: str,
@@ -5,8 +5,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import Any
 
-from aiolyric import Lyric
 from aiolyric.objects.device import LyricDevice
 from aiolyric.objects.location import LyricLocation
 from aiolyric.objects.priority import LyricAccessory, LyricRoom
@@ -19,10 +19,9 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
 from .const import (
@@ -33,40 +32,71 @@ from .const import (
     PRESET_TEMPORARY_HOLD,
     PRESET_VACATION_HOLD,
 )
-from .entity import LyricAccessoryEntity, LyricDeviceEntity, LyricLeakEntity
+from .coordinator import LyricDataUpdateCoordinator
+from .entity import (
+    LyricAccessoryEntity,
+    LyricDeviceEntity,
+    LyricLeakEntity,
+    get_attribute_path,
+    has_attribute_path,
+)
+
+LEAK_SOURCE_READINGS = "currentSensorReadings"
+LEAK_SOURCE_SETTINGS = "deviceSettings"
 
-LYRIC_SETPOINT_STATUS_NAMES = {
-    PRESET_NO_HOLD: "Following Schedule",
-    PRESET_PERMANENT_HOLD: "Held Permanently",
-    PRESET_TEMPORARY_HOLD: "Held Temporarily",
-    PRESET_VACATION_HOLD: "Holiday",
+LYRIC_SETPOINT_STATUS_NAMES: dict[str, Callable[[str], str]] = {
+    PRESET_HOLD_UNTIL: lambda time: f"Held until {time}",
+    PRESET_NO_HOLD: lambda _: "Following Schedule",
+    PRESET_PERMANENT_HOLD: lambda _: "Held Permanently",
+    PRESET_TEMPORARY_HOLD: lambda _: "Held Temporarily",
+    PRESET_VACATION_HOLD: lambda _: "Holiday",
 }
 
 
 @dataclass(frozen=True, kw_only=True)
 class LyricSensorEntityDescription(SensorEntityDescription):
-    """Class describing Honeywell Lyric sensor entities."""
+    """Class describing Honeywell Lyric sensor entities.
 
-    value_fn: Callable[[LyricDevice], StateType | datetime]
-    suitable_fn: Callable[[LyricDevice], bool]
+    ``attr_path`` is the device attribute the sensor reads; the sensor is
+    suitable for a device if it is set. Sensors with an entry in
+    ``_DEVICE_RESOLVERS`` compute their value there instead, and only use
+    ``attr_path`` for setup.
+    """
+
+    attr_path: tuple[str, ...]
 
 
 @dataclass(frozen=True, kw_only=True)
 class LyricSensorAccessoryEntityDescription(SensorEntityDescription):
-    """Class describing Honeywell Lyric room sensor entities."""
+    """Class describing Honeywell Lyric room sensor entities.
+
+    ``attr_path`` starts at the sensor's ``room`` or ``accessory``.
+    """
 
-    value_fn: Callable[[LyricRoom, LyricAccessory], StateType | datetime]
-    suitable_fn: Callable[[LyricRoom, LyricAccessory], bool]
+    attr_path: tuple[str, ...]
+
+
+@dataclass(frozen=True, kw_only=True)
+class LyricLeakSensorEntityDescription(SensorEntityDescription):
+    """Class describing Honeywell Lyric water leak sensor entities.
 
+    ``field`` is a key path into the device attributes, or into one of the
+    nested dicts named by ``source``, which are snapshotted once per update.
+    The sensor is suitable for a device if the field is present.
+    """
 
-DEVICE_SENSORS: list[LyricSensorEntityDescription] = [
+    source: str | None = None
+    field: tuple[str, ...]
+    value_fn: Callable[[Any], StateType] | None = None
+
+
+DEVICE_SENSORS: tuple[LyricSensorEntityDescription, ...] = (
     LyricSensorEntityDescription(
         key="indoor_temperature",
         translation_key="indoor_temperature",
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda device: device.indoor_temperature,
-        suitable_fn=lambda device: device.indoor_temperature,
+        attr_path=("indoor_temperature",),
     ),
     LyricSensorEntityDescription(
         key="indoor_humidity",
@@ -74,16 +104,14 @@ DEVICE_SENSORS: list[LyricSensorEntityDescription] = [
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda device: device.indoor_humidity,
-        suitable_fn=lambda device: device.indoor_humidity,
+        attr_path=("indoor_humidity",),
     ),
     LyricSensorEntityDescription(
         key="outdoor_temperature",
         translation_key="outdoor_temperature",
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda device: device.outdoor_temperature,
-        suitable_fn=lambda device: device.outdoor_temperature,
+        attr_path=("outdoor_temperature",),
     ),
     LyricSensorEntityDescription(
         key="outdoor_humidity",
@@ -91,42 +119,28 @@ DEVICE_SENSORS: list[LyricSensorEntityDescription] = [
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda device: device.displayed_outdoor_humidity,
-        suitable_fn=lambda device: device.displayed_outdoor_humidity,
+        attr_path=("displayed_outdoor_humidity",),
     ),
     LyricSensorEntityDescription(
         key="next_period_time",
         translation_key="next_period_time",
         device_class=SensorDeviceClass.TIMESTAMP,
-        value_fn=lambda device: get_datetime_from_future_time(
-            device.changeable_values.next_period_time
-        ),
-        suitable_fn=lambda device: (
-            device.changeable_values and device.changeable_values.next_period_time
-        ),
+        attr_path=("changeable_values", "next_period_time"),
     ),
     LyricSensorEntityDescription(
         key="setpoint_status",
         translation_key="setpoint_status",
-        value_fn=lambda device: get_setpoint_status(
-            device.changeable_values.thermostat_setpoint_status,
-            device.changeable_values.next_period_time,
-        ),
-        suitable_fn=lambda device: (
-            device.changeable_values
-            and device.changeable_values.thermostat_setpoint_status
-        ),
+        attr_path=("changeable_values", "thermostat_setpoint_status"),
     ),
-]
+)
 
-ACCESSORY_SENSORS: list[LyricSensorAccessoryEntityDescription] = [
+ACCESSORY_SENSORS: tuple[LyricSensorAccessoryEntityDescription, ...] = (
     LyricSensorAccessoryEntityDescription(
         key="room_temperature",
         translation_key="room_temperature",
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda _, accessory: accessory.temperature,
-        suitable_fn=lambda _, accessory: accessory.type == "IndoorAirSensor",
+        attr_path=("accessory", "temperature"),
     ),
     LyricSensorAccessoryEntityDescription(
         key="room_humidity",
@@ -134,99 +148,115 @@ ACCESSORY_SENSORS: list[LyricSensorAccessoryEntityDescription] = [
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda room, _: room.room_avg_humidity,
-        suitable_fn=lambda _, accessory: accessory.type == "IndoorAirSensor",
+        attr_path=("room", "room_avg_humidity"),
     ),
-]
+)
 
-LEAK_SENSORS: list[LyricSensorEntityDescription] = [
-    LyricSensorEntityDescription(
+LEAK_SENSORS: tuple[LyricLeakSensorEntityDescription, ...] = (
+    LyricLeakSensorEntityDescription(
         key="temperature",
         translation_key="temperature",
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda device: device.attributes.get("currentSensorReadings")["temperature"],
-        suitable_fn=lambda device: device.attributes.get("currentSensorReadings"),
+        source=LEAK_SOURCE_READINGS,
+        field=("temperature",),
     ),
-    LyricSensorEntityDescription(
+    LyricLeakSensorEntityDescription(
         key="WarnTempMax",
         translation_key="warn_temp_max",
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda device: device.attributes.get("deviceSettings")["temp"]["high"]["limit"],
-        suitable_fn=lambda device: device.attributes.get("currentSensorReadings"),
+        source=LEAK_SOURCE_SETTINGS,
+        field=("temp", "high", "limit"),
     ),
-    LyricSensorEntityDescription(
+    LyricLeakSensorEntityDescription(
         key="WarnTempMin",
         translation_key="warn_temp_low",
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda device: device.attributes.get("deviceSettings")["temp"]["low"]["limit"],
-        suitable_fn=lambda device: device.attributes.get("currentSensorReadings"),
+        source=LEAK_SOURCE_SETTINGS,
+        field=("temp", "low", "limit"),
     ),
-    LyricSensorEntityDescription(
+    LyricLeakSensorEntityDescription(
         key="humidity",
         translation_key="humidity",
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda device: device.attributes.get("currentSensorReadings")["humidity"],
-        suitable_fn=lambda device: device.attributes.get("currentSensorReadings"),
+        native_unit_of_measurement=PERCENTAGE,
+        source=LEAK_SOURCE_READINGS,
+        field=("humidity",),
     ),
-    LyricSensorEntityDescription(
+    LyricLeakSensorEntityDescription(
         key="WarnHumMax",
         translation_key="warn_hum_max",
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda device: device.attributes.get("deviceSettings")["humidity"]["high"]["limit"],
-        suitable_fn=lambda device: device.attributes.get("currentSensorReadings"),
+        native_unit_of_measurement=PERCENTAGE,
+        source=LEAK_SOURCE_SETTINGS,
+        field=("humidity", "high", "limit"),
     ),
-    LyricSensorEntityDescription(
+    LyricLeakSensorEntityDescription(
         key="WarnHumMin",
         translation_key="warn_hum_low",
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda device: device.attributes.get("deviceSettings")["humidity"]["low"]["limit"],
-        suitable_fn=lambda device: device.attributes.get("currentSensorReadings"),
+        native_unit_of_measurement=PERCENTAGE,
+        source=LEAK_SOURCE_SETTINGS,
+        field=("humidity", "low", "limit"),
     ),
-    LyricSensorEntityDescription(
+    LyricLeakSensorEntityDescription(
         key="Battery",
         translation_key="battery",
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda device: device.attributes.get("batteryRemaining"),
-        suitable_fn=lambda device: device.attributes.get("batteryRemaining"),
+        field=("batteryRemaining",),
     ),
-    LyricSensorEntityDescription(
+    LyricLeakSensorEntityDescription(
         key="WiFi",
         translation_key="wifi",
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda device: abs(device.attributes.get("wifiSignalStrength")),
-        suitable_fn=lambda device: abs(device.attributes.get("wifiSignalStrength")),
+        field=("wifiSignalStrength",),
+        value_fn=abs,
     ),
-    LyricSensorEntityDescription(
+    LyricLeakSensorEntityDescription(
         key="LastCheckin",
         translation_key="last_checkin",
         device_class=None,
         state_class=None,
-        value_fn=lambda device: device.attributes.get("lastCheckin"),
-        suitable_fn=lambda device: device.attributes.get("lastCheckin"),
+        field=("lastCheckin",),
     ),
-    # LyricSensorEntityDescription(
+    # LyricLeakSensorEntityDescription(
     #     key="Firmware",
     #     translation_key="firmwareVer",
     #     device_class=None,
     #     state_class=None,
-    #     value_fn=lambda device: device.attributes.get("firmwareVer"),
-    #     suitable_fn=lambda device: device.attributes.get("firmwareVer"),
+    #     field=("firmwareVer",),
     # ),
-]
+)
 
 def get_setpoint_status(status: str, time: str) -> str | None:
     """Get status of the setpoint."""
-    if status == PRESET_HOLD_UNTIL:
-        return f"Held until {time}"
-    return LYRIC_SETPOINT_STATUS_NAMES.get(status)
+    if (name_fn := LYRIC_SETPOINT_STATUS_NAMES.get(status)) is None:
+        return None
+    return name_fn(time)
+
+
+def leak_sensor_suitable(
+    description: LyricLeakSensorEntityDescription, device: LyricDevice
+) -> bool:
+    """Return whether a leak sensor applies to the device."""
+    data = device.attributes
+    if description.source is not None:
+        data = data.get(description.source)
+    return has_attribute_path(data, description.field)
+
+
+def get_temperature_unit(device: LyricDevice) -> UnitOfTemperature:
+    """Get the temperature unit used by the device."""
+    if device.units == "Fahrenheit":
+        return UnitOfTemperature.FAHRENHEIT
+    return UnitOfTemperature.CELSIUS
 
 
 def get_datetime_from_future_time(time_str: str) -> datetime:
@@ -244,54 +274,54 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the Honeywell Lyric sensor platform based on a config entry."""
-    coordinator: DataUpdateCoordinator[Lyric] = hass.data[DOMAIN][entry.entry_id]
-
-    async_add_entities(
-        LyricSensor(
-            coordinator,
-            device_sensor,
-            location,
-            device,
-        )
-        for location in coordinator.data.locations
-        for device in location.devices
-        for device_sensor in DEVICE_SENSORS
-        if device_sensor.suitable_fn(device)
-    )
-
-    async_add_entities(
-        LyricLeakSensor(
-            coordinator,
-            device_sensor,
-            location,
-            device,
-        )
-        for location in coordinator.data.locations
-        for device in location.devices
-        for device_sensor in LEAK_SENSORS
-    )
-
-    async_add_entities(
-        LyricAccessorySensor(
-            coordinator, accessory_sensor, location, device, room, accessory
-        )
-        for location in coordinator.data.locations
-        for device in location.devices
-        for room in coordinator.data.rooms_dict.get(device.mac_id, {}).values()
-        for accessory in room.accessories
-        for accessory_sensor in ACCESSORY_SENSORS
-        if accessory_sensor.suitable_fn(room, accessory)
-    )
-
+    coordinator: LyricDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    entities: list[SensorEntity] = []
+    for location in coordinator.data.locations:
+        for device in location.devices:
+            entities.extend(
+                LyricSensor(coordinator, device_sensor, location, device)
+                for device_sensor in DEVICE_SENSORS
+                if get_attribute_path(device, device_sensor.attr_path)
+            )
+            if device.attributes.get(LEAK_SOURCE_READINGS) is not None:
+                entities.extend(
+                    LyricLeakSensor(coordinator, device_sensor, location, device)
+                    for device_sensor in LEAK_SENSORS
+                    if leak_sensor_suitable(device_sensor, device)
+                )
+            rooms = coordinator.data.rooms_dict.get(device.mac_id)
+            if not rooms:
+                continue
+            for room in rooms.values():
+                for accessory in room.accessories:
+                    # All room sensors come from indoor air sensor accessories
+                    if accessory.type != "IndoorAirSensor":
+                        continue
+                    entities.extend(
+                        LyricAccessorySensor(
+                            coordinator,
+                            accessory_sensor,
+                            location,
+                            device,
+                            room,
+                            accessory,
+                        )
+                        for accessory_sensor in ACCESSORY_SENSORS
+                    )
+
+    async_add_entities(entities)
 
 class LyricSensor(LyricDeviceEntity, SensorEntity):
     """Define a Honeywell Lyric sensor."""
 
+    __slots__ = ("_cached_next_period", "_cached_setpoint_status")
+
     entity_description: LyricSensorEntityDescription
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator[Lyric],
+        coordinator: LyricDataUpdateCoordinator,
         description: LyricSensorEntityDescription,
         location: LyricLocation,
         device: LyricDevice,
@@ -305,25 +335,57 @@ class LyricSensor(LyricDeviceEntity, SensorEntity):
         )
         self.entity_description = description
         if description.device_class == SensorDeviceClass.TEMPERATURE:
-            if device.units == "Fahrenheit":
-                self._attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
-            else:
-                self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+            self._attr_native_unit_of_measurement = get_temperature_unit(device)
+        self._cached_next_period: tuple[str, datetime] | None = None
+        self._cached_setpoint_status: tuple[str, str, str | None] | None = None
 
     @property
     def native_value(self) -> StateType | datetime:
         """Return the state."""
-        return self.entity_description.value_fn(self.device)
+        if (resolver := _DEVICE_RESOLVERS.get(self.entity_description.key)) is not None:
+            return resolver(self)
+        return get_attribute_path(self.device, self.entity_description.attr_path)
+
+    def _next_period_time(self) -> datetime:
+        """Return the next period time, parsing it only when it changes."""
+        raw = self.device.changeable_values.next_period_time
+        cached = self._cached_next_period
+        # The parsed time rolls over to tomorrow once it has passed
+        if cached and cached[0] == raw and cached[1] > dt_util.utcnow():
+            return cached[1]
+        value = get_datetime_from_future_time(raw)
+        self._cached_next_period = (raw, value)
+        return value
+
+    def _setpoint_status(self) -> str | None:
+        """Return the setpoint status, formatting it only when it changes."""
+        changeable_values = self.device.changeable_values
+        status = changeable_values.thermostat_setpoint_status
+        time = changeable_values.next_period_time
+        cached = self._cached_setpoint_status
+        if cached and cached[0] == status and cached[1] == time:
+            return cached[2]
+        value = get_setpoint_status(status, time)
+        self._cached_setpoint_status = (status, time, value)
+        return value
+
+
+_DEVICE_RESOLVERS: dict[str, Callable[[LyricSensor], StateType | datetime]] = {
+    "next_period_time": LyricSensor._next_period_time,
+    "setpoint_status": LyricSensor._setpoint_status,
+}
 
 class LyricLeakSensor(LyricLeakEntity, SensorEntity):
     """Define a Honeywell Lyric sensor."""
 
-    entity_description: LyricSensorEntityDescription
+    __slots__ = ("_attributes", "_readings", "_settings")
+
+    entity_description: LyricLeakSensorEntityDescription
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator[Lyric],
-        description: LyricSensorEntityDescription,
+        coordinator: LyricDataUpdateCoordinator,
+        description: LyricLeakSensorEntityDescription,
         location: LyricLocation,
         device: LyricDevice,
     ) -> None:
@@ -336,23 +398,38 @@ class LyricLeakSensor(LyricLeakEntity, SensorEntity):
         )
         self.entity_description = description
         if description.device_class == SensorDeviceClass.TEMPERATURE:
-            if device.units == "Fahrenheit":
-                self._attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
-            else:
-                self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        
-        if description.device_class == SensorDeviceClass.HUMIDITY:
-            self._attr_native_unit_of_measurement = PERCENTAGE
+            self._attr_native_unit_of_measurement = get_temperature_unit(device)
+
+        user_defined_name = device.attributes["deviceSettings"]["userDefinedName"]
+        self._attr_name = f"{user_defined_name} {description.key}"
+        self._update_snapshot(device)
+
+    def _update_snapshot(self, device: LyricDevice) -> None:
+        """Snapshot the nested device dicts read by the leak sensors."""
+        self._attributes = device.attributes
+        self._readings = device.attributes.get(LEAK_SOURCE_READINGS) or {}
+        self._settings = device.attributes.get(LEAK_SOURCE_SETTINGS) or {}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the snapshot once per coordinator update."""
+        self._update_snapshot(self.device)
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> StateType | datetime:
         """Return the state."""
-        return self.entity_description.value_fn(self.device)
-
-    @property
-    def name(self) -> str | None:
-        """Define name as description"""
-        return f"{self.device.attributes.get("deviceSettings", None)["userDefinedName"]} {self.entity_description.key}"
+        source = self.entity_description.source
+        if source == LEAK_SOURCE_READINGS:
+            data = self._readings
+        elif source == LEAK_SOURCE_SETTINGS:
+            data = self._settings
+        else:
+            data = self._attributes
+        value = get_attribute_path(data, self.entity_description.field)
+        if value is not None and self.entity_description.value_fn is not None:
+            return self.entity_description.value_fn(value)
+        return value
 
 class LyricAccessorySensor(LyricAccessoryEntity, SensorEntity):
     """Define a Honeywell Lyric sensor."""
@@ -361,7 +438,7 @@ class LyricAccessorySensor(LyricAccessoryEntity, SensorEntity):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator[Lyric],
+        coordinator: LyricDataUpdateCoordinator,
         description: LyricSensorAccessoryEntityDescription,
         location: LyricLocation,
         parentDevice: LyricDevice,
@@ -379,12 +456,9 @@ class LyricAccessorySensor(LyricAccessoryEntity, SensorEntity):
         )
         self.entity_description = description
         if description.device_class == SensorDeviceClass.TEMPERATURE:
-            if parentDevice.units == "Fahrenheit":
-                self._attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
-            else:
-                self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+            self._attr_native_unit_of_measurement = get_temperature_unit(parentDevice)
 
     @property
     def native_value(self) -> StateType | datetime:
         """Return the state."""
-        return self.entity_description.value_fn(self.room, self.accessory)
+        return get_attribute_path(self, self.entity_description.attr_path)